@@ -170,10 +170,10 @@ export function useSkillsData() {
             `
             SELECT skill_path, skill_name, skill_author, skill_display_name,
                    skill_description, skill_version, category, scan_risk_level AS level,
-                   scan_findings_count AS findings, date_added,
+                   scan_findings_count AS findings, date_added::VARCHAR AS date_added,
                    folder_size_bytes, file_count, script_count, md_count
             FROM skills WHERE NOT is_deleted
-            ORDER BY date_added DESC NULLS LAST
+            ORDER BY skills.date_added DESC NULLS LAST
           `,
           ),
           q(